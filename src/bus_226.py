@@ -6,6 +6,8 @@ import numpy as np
 import os
 from dotenv import load_dotenv
 
+from jsonapi import wrap_responses, prediction_time, minutes_until
+
 # Import the SSL-fixed version of Predictions
 try:
     # Try to use our SSL fix first
@@ -14,11 +16,23 @@ try:
 except ImportError:
     # Fall back to original if not available
     from pymbta3 import Predictions
+    # Return JsonApiDocument responses like the SSL-fixed client
+    Predictions = wrap_responses(Predictions)
     print("Using standard pymbta3 library")
 
+from service_alerts import ServiceAlerts, describe_alert, BUS_226_STOPS
+
 # Load environment variables at module level
 load_dotenv()
 
+# Route 226 alerts, kept between checks so they can refresh while the monitor sleeps
+service_alerts = ServiceAlerts(routes=['226'])
+
+
+def bus_226_disruption():
+    """Return the active alert that suspends route 226 or closes its Braintree stop, or None"""
+    return service_alerts.blocking('226', BUS_226_STOPS, direction_id=0)
+
 
 def check_bus_226():
     """Check Bus 226 arrivals at Braintree Station and notify when it's time to leave"""
@@ -38,46 +52,61 @@ def check_bus_226():
     at = Predictions(key=mbta_api_key)
 
     try:
+        # Don't poll for predictions that will never come while route 226 is suspended or Braintree is closed
+        service_alerts.refresh()
+        disruption = bus_226_disruption()
+        if disruption:
+            service_alerts.pause(f"Bus 226 service disrupted - {describe_alert(disruption)}",
+                                 until=lambda: bus_226_disruption() is None)
+            check_bus_226()  # recur
+            return
+
         # Get predictions for the 226 bus from Braintree Station to Columbian Square
         # Using route 226, direction 0 (Outbound to Columbian Square)
         braintree_stop_id = "place-brntn"  # Braintree Station
-        predictions = at.get(route='226', direction_id=0, stop=braintree_stop_id, route_pattern='226-_-0')
+        # Include the schedule so buses without a live prediction fall back to their scheduled time
+        predictions = at.get(include='schedule', route='226', direction_id=0,
+                             stop=braintree_stop_id, route_pattern='226-_-0')
 
         if not predictions.get('data'):
             print("No predictions available. Checking again in 3 minutes...")
-            t.sleep(3 * 60)
+            service_alerts.print_active('226', BUS_226_STOPS, direction_id=0)
+            service_alerts.sleep(3, until=lambda: bus_226_disruption() is not None)
             check_bus_226()  # recur
             return
 
-        # Extract arrival times in minutes
-        bus_times = []
-        time_format = '%Y-%m-%dT%H:%M:%S%z'
+        # Extract arrival times in minutes, noting which ones come from the schedule
+        buses = []
 
         print("\nProcessing bus departure predictions...")
         for prediction in predictions['data']:
             # Use departure_time or arrival_time based on availability
-            time_attribute = prediction['attributes'].get('departure_time') or prediction['attributes'].get('arrival_time')
+            time_attribute, scheduled = prediction_time(predictions, prediction)
             if time_attribute:
-                minutes_until = (datetime.datetime.strptime(time_attribute, time_format).astimezone(
-                    datetime.timezone.utc) - datetime.datetime.now(datetime.timezone.utc)).seconds/60
-                bus_times.append(math.floor(minutes_until))
+                minutes = math.floor(minutes_until(time_attribute))
+                # Skip buses that have already left
+                if minutes >= 0:
+                    buses.append((minutes, scheduled))
 
         # Check if we have any predictions
-        if not bus_times:
+        if not buses:
             print("No upcoming buses found. Checking again in 3 minutes...")
-            t.sleep(3 * 60)
+            service_alerts.print_active('226', BUS_226_STOPS, direction_id=0)
+            service_alerts.sleep(3, until=lambda: bus_226_disruption() is not None)
             check_bus_226()  # recur
             return
 
         # Sort times in ascending order
-        bus_times.sort()
+        buses.sort()
+        bus_times = [minutes for minutes, _ in buses]
 
         # Print upcoming bus times
         print("\nUPCOMING BUS 226 DEPARTURES FROM BRAINTREE STATION:")
-        for i, minutes in enumerate(bus_times):
+        for i, (minutes, scheduled) in enumerate(buses):
             # Format time as HH:MM
             departure_time = (datetime.datetime.now() + datetime.timedelta(minutes=minutes)).strftime("%I:%M %p")
-            print(f"  Bus {i+1}: Departing in {minutes} minutes (at {departure_time})")
+            source = " [scheduled, no live prediction]" if scheduled else ""
+            print(f"  Bus {i+1}: Departing in {minutes} minutes (at {departure_time}){source}")
 
         # Calculate time gaps between buses
         if len(bus_times) > 1:
@@ -110,8 +139,8 @@ def check_bus_226():
         print(f"\nNext bus in {next_bus} minutes. Checking again in {loop_time:.1f} minutes...")
         print("=" * 60)
 
-        # Sleep before checking again
-        t.sleep(int(loop_time * 60))
+        # Sleep before checking again, waking up early if route 226 gets suspended
+        service_alerts.sleep(loop_time, until=lambda: bus_226_disruption() is not None)
         check_bus_226()  # recur
 
     except Exception as e:
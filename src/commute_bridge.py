@@ -5,6 +5,8 @@ import time as t
 import os
 from dotenv import load_dotenv
 
+from jsonapi import wrap_responses, prediction_time, minutes_until
+
 # Import the SSL-fixed version of Predictions
 try:
     # Try to use our SSL fix first
@@ -13,15 +15,41 @@ try:
 except ImportError:
     # Fall back to original if not available
     from pymbta3 import Predictions
+    # Return JsonApiDocument responses like the SSL-fixed client
+    Predictions = wrap_responses(Predictions)
     print("Using standard pymbta3 library")
 
+from service_alerts import (ServiceAlerts, describe_alert, RED_LINE_STOPS, BUS_226_STOPS,
+                            COMMUTER_RAIL_ROUTES, COMMUTER_RAIL_STOPS)
+
 # Load environment variables at module level
 load_dotenv()
 
+# Minimum travel time from South Station to the 226 at Braintree, per leg
+RED_LINE_TRAVEL_TIME = 30
+COMMUTER_RAIL_TRAVEL_TIME = 20
+
+# Every watched (route, stops) leg, all travelling in direction 0
+WATCHED_LEGS = [('226', BUS_226_STOPS), ('Red', RED_LINE_STOPS)] + [
+    (route, COMMUTER_RAIL_STOPS) for route in COMMUTER_RAIL_ROUTES]
+
+# Alerts for every leg of the commute, shared by all checks
+service_alerts = ServiceAlerts(routes=[route for route, _ in WATCHED_LEGS])
+
+
+def get_disruption(route, stops):
+    """Return the active alert that suspends or shuttles a watched leg, or None"""
+    return service_alerts.blocking(route, stops, direction_id=0)
+
+
+def disruption_state():
+    """Which watched legs are blocked, waits end early when this changes"""
+    return tuple(get_disruption(route, stops) is not None for route, stops in WATCHED_LEGS)
+
 
-def get_train_times():
-    """Get Red Line train departure times in minutes from now"""
-    print("Fetching Red Line train predictions...")
+def get_train_times(route, stop, route_pattern=None):
+    """Get train departure times from a stop, in direction 0, in minutes from now"""
+    print(f"Fetching {route if isinstance(route, str) else ', '.join(route)} train predictions...")
 
     # Get API key from environment variables
     mbta_api_key = os.environ.get('MBTA_API_KEY', 'demo')
@@ -30,26 +58,67 @@ def get_train_times():
 
     at = Predictions(key=mbta_api_key)
 
-    predictions = at.get(stop=70079, direction_id=0,
-                        route='Red', route_pattern='Red-3-0')
+    predictions = at.get(stop=stop, direction_id=0,
+                         route=route, route_pattern=route_pattern)
 
     train_times = []
-    time_format = '%Y-%m-%dT%H:%M:%S%z'
 
     for prediction in predictions.get('data', []):
         departure_time = prediction['attributes'].get('departure_time')
         if departure_time:
-            minutes_until = (datetime.datetime.strptime(departure_time, time_format).astimezone(
-                datetime.timezone.utc) - datetime.datetime.now(datetime.timezone.utc)).seconds/60
-            train_times.append(math.floor(minutes_until))
+            minutes = math.floor(minutes_until(departure_time))
+            # Skip trains that have already left
+            if minutes >= 0:
+                train_times.append(minutes)
 
     # Sort times in ascending order
     train_times.sort()
     return train_times
 
 
+def get_train_leg():
+    """
+    Pick the train leg to Braintree based on active service alerts.
+    Returns a dict with the leg name, its routes and stops, departure times and minimum travel time,
+    or None if no train leg is running.
+    """
+    red_line_disruption = get_disruption('Red', RED_LINE_STOPS)
+    if not red_line_disruption:
+        return {
+            "name": "RED LINE",
+            "routes": ['Red'],
+            "stops": RED_LINE_STOPS,
+            "train_times": get_train_times('Red', 70079, route_pattern='Red-3-0'),
+            "travel_time": RED_LINE_TRAVEL_TIME
+        }
+
+    print(f"\nRed Line service disrupted - {describe_alert(red_line_disruption)}")
+    running_routes = []
+    for route in COMMUTER_RAIL_ROUTES:
+        commuter_rail_disruption = get_disruption(route, COMMUTER_RAIL_STOPS)
+        if commuter_rail_disruption:
+            print(f"{route} service disrupted - {describe_alert(commuter_rail_disruption)}")
+        else:
+            running_routes.append(route)
+
+    if not running_routes:
+        return None
+
+    print("Switching to the commuter rail from South Station...")
+    return {
+        "name": "COMMUTER RAIL",
+        "routes": running_routes,
+        "stops": COMMUTER_RAIL_STOPS,
+        "train_times": get_train_times(running_routes, 'place-sstat'),
+        "travel_time": COMMUTER_RAIL_TRAVEL_TIME
+    }
+
+
 def get_bus_times():
-    """Get 226 bus departure times from Braintree Station in minutes from now"""
+    """
+    Get 226 bus departure times from Braintree Station in minutes from now.
+    Returns sorted (minutes, scheduled) pairs, scheduled is True for times taken from the schedule.
+    """
     print("Fetching Bus 226 predictions...")
 
     # Get API key from environment variables
@@ -58,21 +127,22 @@ def get_bus_times():
 
     # Get predictions for the 226 bus from Braintree Station to Columbian Square
     braintree_stop_id = "place-brntn"  # Braintree Station
-    predictions = at.get(route='226', direction_id=0, stop=braintree_stop_id, route_pattern='226-_-0')
+    predictions = at.get(include='schedule', route='226', direction_id=0,
+                         stop=braintree_stop_id, route_pattern='226-_-0')
 
-    bus_times = []
-    time_format = '%Y-%m-%dT%H:%M:%S%z'
+    buses = []
 
     for prediction in predictions.get('data', []):
-        time_attribute = prediction['attributes'].get('departure_time') or prediction['attributes'].get('arrival_time')
+        time_attribute, scheduled = prediction_time(predictions, prediction)
         if time_attribute:
-            minutes_until = (datetime.datetime.strptime(time_attribute, time_format).astimezone(
-                datetime.timezone.utc) - datetime.datetime.now(datetime.timezone.utc)).seconds/60
-            bus_times.append(math.floor(minutes_until))
+            minutes = math.floor(minutes_until(time_attribute))
+            # Skip buses that have already left
+            if minutes >= 0:
+                buses.append((minutes, scheduled))
 
     # Sort times in ascending order
-    bus_times.sort()
-    return bus_times
+    buses.sort()
+    return buses
 
 
 def find_connections(train_times, bus_times, min_travel_time=30):
@@ -119,42 +189,73 @@ def commute_bridge():
     print("=" * 70)
 
     try:
-        # Get Red Line train times
-        train_times = get_train_times()
+        service_alerts.refresh()
+        # Every wait below ends early when a watched leg gets disrupted or recovers
+        state = disruption_state()
+
+        def alerts_changed():
+            return disruption_state() != state
+
+        # Don't poll for bus predictions that will never come while route 226 is suspended
+        bus_disruption = get_disruption('226', BUS_226_STOPS)
+        if bus_disruption:
+            service_alerts.pause(f"No viable connections: Bus 226 service disrupted - {describe_alert(bus_disruption)}",
+                                 until=alerts_changed)
+            commute_bridge()
+            return
+
+        # Get train times, from the commuter rail if the Red Line is disrupted
+        train_leg = get_train_leg()
+
+        if train_leg is None:
+            service_alerts.pause("No viable connections: no train service to Braintree.", until=alerts_changed)
+            commute_bridge()
+            return
+
+        leg_name = train_leg["name"]
+        train_times = train_leg["train_times"]
 
         if not train_times:
-            print("\nNo upcoming Red Line trains found. Checking again in 3 minutes...")
-            t.sleep(3 * 60)
+            print(f"\nNo upcoming {leg_name.title()} trains found. Checking again in 3 minutes...")
+            for route in train_leg["routes"]:
+                service_alerts.print_active(route, train_leg["stops"], direction_id=0)
+            service_alerts.sleep(3, until=alerts_changed)
             commute_bridge()
             return
 
         # Print upcoming train times
-        print("\nUPCOMING RED LINE TRAINS:")
+        print(f"\nUPCOMING {leg_name} TRAINS:")
         for i, minutes in enumerate(train_times):
             arrival_time = format_time(minutes)
             print(f"  Train {i+1}: Departing in {minutes} minutes (at {arrival_time})")
 
         # Get Bus 226 times
-        bus_times = get_bus_times()
+        buses = get_bus_times()
+        bus_times = [minutes for minutes, _ in buses]
 
         if not bus_times:
             print("\nNo upcoming 226 buses found. Checking again in 3 minutes...")
-            t.sleep(3 * 60)
+            service_alerts.print_active('226', BUS_226_STOPS, direction_id=0)
+            service_alerts.sleep(3, until=alerts_changed)
             commute_bridge()
             return
 
         # Print upcoming bus times
         print("\nUPCOMING BUS 226 DEPARTURES FROM BRAINTREE:")
-        for i, minutes in enumerate(bus_times):
+        for i, (minutes, scheduled) in enumerate(buses):
             departure_time = format_time(minutes)
-            print(f"  Bus {i+1}: Departing in {minutes} minutes (at {departure_time})")
+            source = " [scheduled, no live prediction]" if scheduled else ""
+            print(f"  Bus {i+1}: Departing in {minutes} minutes (at {departure_time}){source}")
 
-        # Find viable connections with 30-minute minimum travel time
-        connections = find_connections(train_times, bus_times, min_travel_time=30)
+        # Find viable connections with the leg's minimum travel time
+        connections = find_connections(train_times, bus_times, min_travel_time=train_leg["travel_time"])
 
         if not connections:
             print("\nNo viable train-bus connections found. Checking again in 5 minutes...")
-            t.sleep(5 * 60)
+            for route in train_leg["routes"]:
+                service_alerts.print_active(route, train_leg["stops"], direction_id=0)
+            service_alerts.print_active('226', BUS_226_STOPS, direction_id=0)
+            service_alerts.sleep(5, until=alerts_changed)
             commute_bridge()
             return
 
@@ -200,7 +301,7 @@ def commute_bridge():
         next_check_time = min(5, max(1, optimal["train_time"] - 10))  # Check at least 10 mins before optimal train
         print(f"\nChecking again in {next_check_time} minutes...")
         print("=" * 70)
-        t.sleep(next_check_time * 60)
+        service_alerts.sleep(next_check_time, until=alerts_changed)
         commute_bridge()
 
     except Exception as e:
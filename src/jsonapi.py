@@ -0,0 +1,101 @@
+"""
+JSON:API Response Helpers
+
+This module provides a dict wrapper for MBTA v3 API responses that resolves
+relationships against the "included" resources in constant time.
+"""
+
+import datetime
+
+# Format of the times in MBTA v3 API responses
+TIME_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+
+# Schedule relationships of predictions for trips that will not stop
+NOT_RUNNING = ('CANCELLED', 'SKIPPED')
+
+
+class JsonApiDocument(dict):
+    """
+    A JSON:API response document.
+
+    Behaves exactly like the parsed JSON dict, but adds lookups into the
+    "included" list. The (type, id) index over "included" is built lazily on
+    the first lookup, so responses fetched without ``include`` pay nothing.
+    The index is not refreshed if "included" is modified afterwards.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._included_index = None
+
+    @property
+    def included_index(self):
+        """Map of (type, id) to included resource, built on first access."""
+        if self._included_index is None:
+            self._included_index = {
+                (resource['type'], resource['id']): resource
+                for resource in self.get('included') or []
+            }
+        return self._included_index
+
+    def included_resource(self, resource_type, resource_id):
+        """Return the included resource with the given type and id, or None."""
+        return self.included_index.get((resource_type, resource_id))
+
+    def related(self, resource, relationship):
+        """
+        Resolve a relationship of a resource against the included resources.
+        Keyword Arguments:
+            resource: A resource object, e.g. an entry of document['data']
+            relationship: Relationship name, e.g. 'trip', 'vehicle', 'alerts'
+        Returns the included resource for a to-one relationship (or None if it is empty or was not
+        included), and a list of the included resources for a to-many relationship.
+        """
+        linkage = (resource.get('relationships') or {}).get(relationship, {}).get('data')
+        if isinstance(linkage, list):
+            resolved = (self.included_resource(item['type'], item['id']) for item in linkage)
+            return [item for item in resolved if item is not None]
+        if not linkage:
+            return None
+        return self.included_resource(linkage['type'], linkage['id'])
+
+
+def wrap_responses(client_class):
+    """
+    Return a subclass of an API client whose get() returns a JsonApiDocument.
+    Used for the plain pymbta3 clients, the SSL-fixed clients already return documents.
+    """
+    class _JsonApiClient(client_class):
+        def get(self, *args, **kwargs):
+            return JsonApiDocument(super().get(*args, **kwargs))
+
+    _JsonApiClient.__name__ = client_class.__name__
+    return _JsonApiClient
+
+
+def minutes_until(time_attribute):
+    """Return the signed number of minutes from now until an API time, negative if it has passed"""
+    departure = datetime.datetime.strptime(time_attribute, TIME_FORMAT).astimezone(datetime.timezone.utc)
+    return (departure - datetime.datetime.now(datetime.timezone.utc)).total_seconds() / 60
+
+
+def prediction_time(predictions, prediction):
+    """
+    Return (time, scheduled) for a prediction, where time is the predicted departure or arrival time and
+    scheduled tells whether it comes from the included schedule instead of a live prediction.
+    The schedule is only used when there is no live time, the trip is not cancelled or skipping the stop,
+    and the scheduled time has not passed yet. Otherwise (None, False) is returned.
+    """
+    attributes = prediction['attributes']
+    time_attribute = attributes.get('departure_time') or attributes.get('arrival_time')
+    if time_attribute:
+        return time_attribute, False
+    if attributes.get('schedule_relationship') in NOT_RUNNING:
+        return None, False
+
+    schedule = predictions.related(prediction, 'schedule')
+    if schedule:
+        time_attribute = schedule['attributes'].get('departure_time') or schedule['attributes'].get('arrival_time')
+        if time_attribute and minutes_until(time_attribute) >= 0:
+            return time_attribute, True
+    return None, False
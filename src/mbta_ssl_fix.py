@@ -10,6 +10,8 @@ from functools import wraps
 import inspect
 from typing import Union, Optional, Dict, Any
 
+from jsonapi import JsonApiDocument
+
 # Option 1: Using curl_cffi
 try:
     from curl_cffi import requests as curl_requests
@@ -28,6 +30,8 @@ class PyMBTA3SSL(object):
     Modified version of PyMBTA3 class that handles SSL issues.
     """
     _MBTA_V3_API_URL = 'https://api-v3.mbta.com'
+    # Relationships accepted by ``include``, None to skip validation
+    _INCLUDES = None
 
     def __init__(self, key: str = None, use_curl_cffi: bool = True):
         """Initialize the class
@@ -69,6 +73,8 @@ class PyMBTA3SSL(object):
             self.session = requests.Session()
 
         self.headers = {"X-API-Key": self.key, "accept": 'application/vnd.api+json'}
+        # Last-Modified header and document of the latest response per url, used for conditional requests
+        self._conditional_cache = {}
 
     @classmethod
     def _call_api_on_func(cls, func):
@@ -107,49 +113,78 @@ class PyMBTA3SSL(object):
 
             # Form the base url, the original function called must return the function name defined in the MBTA api
             function_name = func(self, *args, **kwargs)
-            url = f'{PyMBTA3SSL._MBTA_V3_API_URL}/{function_name}'
+            params = []
             for idx, arg_name in enumerate(argspec.args[1:]):
                 try:
                     arg_value = args[idx]
                 except IndexError:
                     arg_value = used_kwargs[arg_name]
 
-                if arg_value:
+                # Discard argument in the url formation if it was set to None (in other words, this will call
+                # the api with its internal defined parameter)
+                if arg_value is not None and arg_value not in ('', [], ()):
+                    if isinstance(arg_value, tuple) or isinstance(arg_value, list):
+                        # If the argument is given as list, then we have to format it, you gotta format it nicely
+                        arg_value = ','.join(str(value) for value in arg_value)
                     if arg_name == 'include':
-                        if isinstance(arg_value, tuple) or isinstance(arg_value, list):
-                            # If the argument is given as list, then we have to format it, you gotta format it nicely
-                            arg_value = ','.join(arg_value)
-                        url = '{}include={}'.format(url, arg_value)
+                        params.append(f'include={self._format_include(arg_value)}')
                     else:
-                        # Discard argument in the url formation if it was set to None (in other words, this will call
-                        # the api with its internal defined parameter)
-                        if isinstance(arg_value, tuple) or isinstance(arg_value, list):
-                            # If the argument is given as list, then we have to format it, you gotta format it nicely
-                            arg_value = ','.join(arg_value)
-                        url = '{}&filter[{}]={}'.format(url, arg_name, arg_value)
+                        params.append(f'filter[{arg_name}]={arg_value}')
+
+            url = f'{PyMBTA3SSL._MBTA_V3_API_URL}/{function_name}'
+            if params:
+                url = f"{url}?{'&'.join(params)}"
             return self._handle_api_call(url)
         return _call_wrapper
 
+    def _format_include(self, include: str):
+        """
+        Normalize and validate the relationships requested through ``include``. It raises a ValueError on
+        unknown names, only the first segment of nested includes such as 'stop.connecting_stops' is checked
+        include:  Comma separated relationship names, spaces and empty names are dropped
+        """
+        names = [name.strip() for name in include.split(',') if name.strip()]
+        if self._INCLUDES is not None:
+            unknown = [name for name in names if name.split('.')[0] not in self._INCLUDES]
+            if unknown:
+                raise ValueError(f"Unsupported include for {type(self).__name__}: {', '.join(unknown)}. "
+                                 f"Valid values are: {', '.join(self._INCLUDES)}")
+        return ','.join(names)
+
     def _handle_api_call(self, url):
         """
-        Handle the return call from the api and return a data and meta_data object. It raises a ValueError on problems
+        Handle the return call from the api and return it as a JsonApiDocument. It raises a ValueError on problems
+        Repeated calls on the same url are sent as conditional requests, and the previous document is returned
+        when the api answers 304 Not Modified.
         url:  The url of the service
         """
+        headers = self.headers
+        cached = self._conditional_cache.get(url)
+        if cached:
+            headers = {**self.headers, "If-Modified-Since": cached[0]}
+
         try:
             if self.use_curl_cffi:
                 # Option 1: Using curl_cffi
-                response = self.session.get(url, headers=self.headers)
+                response = self.session.get(url, headers=headers)
             else:
                 # Option 2: Using standard requests
                 response = self.session.get(
-                    url, headers=self.headers, verify=self.ssl_verify
+                    url, headers=headers, verify=self.ssl_verify
                 )
 
+            if response.status_code == 304 and cached:
+                return cached[1]
+
             json_response = response.json()
             if not json_response:
                 raise ValueError('Error getting data from the api, no return was given.')
 
-            return json_response
+            document = JsonApiDocument(json_response)
+            last_modified = response.headers.get("Last-Modified")
+            if last_modified and response.status_code == 200:
+                self._conditional_cache[url] = (last_modified, document)
+            return document
         except Exception as e:
             print(f"Error making API request: {str(e)}")
             raise
@@ -159,6 +194,8 @@ class PredictionsSSL(PyMBTA3SSL):
     """
     Modified version of Predictions class that handles SSL issues.
     """
+    _INCLUDES = ('schedule', 'stop', 'route', 'trip', 'vehicle', 'alerts')
+
     @PyMBTA3SSL._call_api_on_func
     def get(self,
             include: Union[str, list, tuple] = None,
@@ -175,7 +212,8 @@ class PredictionsSSL(PyMBTA3SSL):
         https://api-v3.mbta.com/docs/swagger/index.html#/Prediction/ApiWeb_PredictionController_index
         Keyword Arguments:
         :param include: Relationships to include. [schedule, stop, route, trip, vehicle, alerts]
-        Includes data from related objects in the "included" keyword
+        Includes data from related objects in the "included" keyword, resolve them with
+        JsonApiDocument.related(prediction, name)
         :param direction_id: Filter by direction of travel along the route.
         :param latitude: Latitude in degrees North
         :param longitude: Longitude in degrees East
@@ -185,5 +223,49 @@ class PredictionsSSL(PyMBTA3SSL):
         :param stop: Filter by /data/{index}/relationships/stop/data/id.
         :param trip: Filter by /data/{index}/relationships/trip/data/id.
         """
-        _CALL_KEY = "predictions?"
+        _CALL_KEY = "predictions"
+        return _CALL_KEY
+
+
+class AlertsSSL(PyMBTA3SSL):
+    """
+    Modified version of Alerts class that handles SSL issues.
+    """
+    _INCLUDES = ('stops', 'routes', 'trips', 'facilities')
+
+    @PyMBTA3SSL._call_api_on_func
+    def get(self,
+            include: Union[str, list, tuple] = None,
+            activity: Union[str, list, tuple] = None,
+            route_type: Union[str, list, tuple] = None,
+            direction_id: Union[str, list, tuple] = None,
+            route: Union[str, list, tuple] = None,
+            stop: Union[str, list, tuple] = None,
+            trip: Union[str, list, tuple] = None,
+            facility: Union[str, list, tuple] = None,
+            id: Union[str, list, tuple] = None,
+            banner: Union[str, list, tuple] = None,
+            datetime: Union[str, list, tuple] = None,
+            lifecycle: Union[str, list, tuple] = None,
+            severity: Union[str, list, tuple] = None):
+        """
+        List active and upcoming system alerts.
+        https://api-v3.mbta.com/docs/swagger/index.html#/Alert/ApiWeb_AlertController_index
+        Keyword Arguments:
+        :param include: Relationships to include. [stops, routes, trips, facilities]
+        Includes data from related objects in the "included" keyword
+        :param activity: Filter to alerts for only those activities, e.g. BOARD, EXIT, RIDE or ALL.
+        :param route_type: Filter by route type.
+        :param direction_id: Filter by direction of travel along the route.
+        :param route: Filter by /data/{index}/attributes/informed_entity/{index}/route.
+        :param stop: Filter by /data/{index}/attributes/informed_entity/{index}/stop.
+        :param trip: Filter by /data/{index}/attributes/informed_entity/{index}/trip.
+        :param facility: Filter by /data/{index}/attributes/informed_entity/{index}/facility.
+        :param id: Filter by multiple IDs.
+        :param banner: When combined with other filters, filters by alerts with or without a banner.
+        :param datetime: Filter to alerts that are active at a given time (ISO8601 format), or NOW.
+        :param lifecycle: Filters by an alert's lifecycle, e.g. NEW, ONGOING, ONGOING_UPCOMING or UPCOMING.
+        :param severity: Filters alerts by list of severities.
+        """
+        _CALL_KEY = "alerts"
         return _CALL_KEY
@@ -7,6 +7,8 @@ import numpy as np
 import os
 from dotenv import load_dotenv
 
+from jsonapi import wrap_responses
+
 # Import the SSL-fixed version of Predictions
 try:
     # Try to use our SSL fix first
@@ -15,11 +17,18 @@ try:
 except ImportError:
     # Fall back to original if not available
     from pymbta3 import Predictions
+    # Return JsonApiDocument responses like the SSL-fixed client
+    Predictions = wrap_responses(Predictions)
     print("Using standard pymbta3 library")
 
+from service_alerts import ServiceAlerts, describe_alert, RED_LINE_STOPS
+
 # Load environment variables
 load_dotenv()
 
+# Red Line alerts, kept between checks so they can refresh while the monitor sleeps
+service_alerts = ServiceAlerts(routes=['Red'])
+
 
 def show_alert(title, message):
     """Display an alert box that blocks until the user closes it."""
@@ -29,6 +38,38 @@ def show_alert(title, message):
     root.destroy()
 
 
+def red_line_disruption():
+    """Return the active alert that suspends or shuttles the watched Red Line leg, or None"""
+    return service_alerts.blocking('Red', RED_LINE_STOPS, direction_id=0)
+
+
+# Vehicle statuses, as phrases followed by a stop name and as phrases that stand alone
+VEHICLE_STATUS_AT_STOP = {
+    'STOPPED_AT': 'stopped at',
+    'INCOMING_AT': 'arriving at',
+    'IN_TRANSIT_TO': 'heading to',
+}
+VEHICLE_STATUS = {
+    'STOPPED_AT': 'stopped at a station',
+    'INCOMING_AT': 'arriving at a station',
+    'IN_TRANSIT_TO': 'between stations',
+}
+
+
+def describe_train(predictions, prediction):
+    """Describe where a predicted train is from its included vehicle and stop, e.g. - now stopped at Andrew"""
+    vehicle = predictions.related(prediction, 'vehicle')
+    if not vehicle:
+        return ""
+    status = vehicle['attributes'].get('current_status')
+    stop = predictions.related(vehicle, 'stop')
+    if status in VEHICLE_STATUS_AT_STOP and stop and stop['attributes'].get('name'):
+        return f" - now {VEHICLE_STATUS_AT_STOP[status]} {stop['attributes']['name']}"
+    if status in VEHICLE_STATUS:
+        return f" - now {VEHICLE_STATUS[status]}"
+    return ""
+
+
 def check_red_line():
     """Check Red Line train arrivals and notify when it's time to leave"""
     # Print header with timestamp
@@ -47,18 +88,29 @@ def check_red_line():
     at = Predictions(key=mbta_api_key)
 
     try:
+        # Don't poll for predictions that will never come while the Red Line is suspended or shuttled
+        service_alerts.refresh()
+        disruption = red_line_disruption()
+        if disruption:
+            service_alerts.pause(f"Red Line service disrupted - {describe_alert(disruption)}",
+                                 until=lambda: red_line_disruption() is None)
+            check_red_line()  # recur
+            return
+
         # Get predictions for Red Line trains (Braintree branch, northbound)
-        predictions = at.get(stop=70079, direction_id=0,
-                            route='Red', route_pattern='Red-3-0')
+        # Include each vehicle and its stop so train positions resolve without extra requests
+        predictions = at.get(include=['vehicle', 'vehicle.stop'], stop=70079, direction_id=0,
+                             route='Red', route_pattern='Red-3-0')
 
         if not predictions.get('data'):
             print("No predictions available. Checking again in 3 minutes...")
-            t.sleep(3 * 60)
+            service_alerts.print_active('Red', RED_LINE_STOPS, direction_id=0)
+            service_alerts.sleep(3, until=lambda: red_line_disruption() is not None)
             check_red_line()  # recur
             return
 
-        # Extract arrival times in minutes
-        lead_times = []
+        # Extract arrival times in minutes, along with a description of each train
+        trains = []
         time_format = '%Y-%m-%dT%H:%M:%S%z'
 
         for prediction in predictions['data']:
@@ -66,23 +118,25 @@ def check_red_line():
             if departure_time:
                 minutes_until = (datetime.datetime.strptime(departure_time, time_format).astimezone(
                     datetime.timezone.utc) - datetime.datetime.now(datetime.timezone.utc)).seconds/60
-                lead_times.append(math.floor(minutes_until))
+                trains.append((math.floor(minutes_until), describe_train(predictions, prediction)))
 
-        if not lead_times:
+        if not trains:
             print("No upcoming trains found. Checking again in 3 minutes...")
-            t.sleep(3 * 60)
+            service_alerts.print_active('Red', RED_LINE_STOPS, direction_id=0)
+            service_alerts.sleep(3, until=lambda: red_line_disruption() is not None)
             check_red_line()  # recur
             return
 
         # Sort times in ascending order
-        lead_times.sort()
+        trains.sort(key=lambda train: train[0])
+        lead_times = [minutes for minutes, _ in trains]
 
         # Print upcoming train times
         print("\nUPCOMING RED LINE TRAINS:")
-        for i, minutes in enumerate(lead_times):
+        for i, (minutes, description) in enumerate(trains):
             # Format time as HH:MM
             arrival_time = (datetime.datetime.now() + datetime.timedelta(minutes=minutes)).strftime("%I:%M %p")
-            print(f"  Train {i+1}: Arriving in {minutes} minutes (at {arrival_time})")
+            print(f"  Train {i+1}: Arriving in {minutes} minutes (at {arrival_time}){description}")
 
         # Calculate time gaps between trains
         if len(lead_times) > 1:
@@ -115,8 +169,8 @@ def check_red_line():
         print(f"\nNext train in {next_train} minutes. Checking again in {loop_time:.1f} minutes...")
         print("=" * 60)
 
-        # Sleep before checking again
-        t.sleep(int(loop_time * 60))
+        # Sleep before checking again, waking up early if the Red Line gets suspended or shuttled
+        service_alerts.sleep(loop_time, until=lambda: red_line_disruption() is not None)
         check_red_line()  # recur
 
     except Exception as e:
@@ -0,0 +1,203 @@
+"""
+MBTA Service Alerts
+
+This module keeps an index of the active MBTA service alerts for the routes a monitor watches, so
+the monitors can pause prediction queries during suspensions and shuttles and explain why.
+"""
+
+import os
+import time as t
+
+# Import the SSL-fixed version of Alerts
+try:
+    # Try to use our SSL fix first
+    from mbta_ssl_fix import AlertsSSL as Alerts
+except ImportError:
+    # Fall back to original if not available
+    from pymbta3 import Alerts
+
+# Alert effects that mean no predictions will come for the affected route or stop
+BLOCKING_EFFECTS = ('SUSPENSION', 'SHUTTLE', 'STOP_CLOSURE', 'STATION_CLOSURE', 'NO_SERVICE')
+
+# Maximum minutes to pause prediction queries while a watched leg is disrupted, alerts are still
+# checked every refresh interval and the pause ends as soon as the disruption clears
+DISRUPTION_PAUSE_MINUTES = 10
+
+# Stops of each watched leg, with the activities the leg needs at each. All legs travel in direction 0.
+# Parent stations and Braintree-bound platforms are both listed, alerts may inform either.
+RED_LINE_STOPS = {
+    'place-sstat': ('BOARD',), '70079': ('BOARD',),
+    'place-brdwy': ('RIDE',), '70081': ('RIDE',),
+    'place-andrw': ('RIDE',), '70083': ('RIDE',),
+    'place-jfk': ('RIDE',), '70095': ('RIDE',),
+    'place-nqncy': ('RIDE',), '70097': ('RIDE',),
+    'place-wlsta': ('RIDE',), '70099': ('RIDE',),
+    'place-qnctr': ('RIDE',), '70101': ('RIDE',),
+    'place-qamnl': ('RIDE',), '70103': ('RIDE',),
+    'place-brntn': ('EXIT',), '70105': ('EXIT',),
+}
+# The 226 is boarded at Braintree, route-wide alerts cover the rest of the route
+BUS_226_STOPS = {'place-brntn': ('BOARD',)}
+
+# Old Colony commuter rail lines from South Station that stop at Braintree, used when the Red Line is disrupted
+COMMUTER_RAIL_ROUTES = ['CR-Kingston', 'CR-Middleborough', 'CR-NewBedford']
+COMMUTER_RAIL_STOPS = {
+    'place-sstat': ('BOARD',),
+    'place-jfk': ('RIDE',),
+    'place-qnctr': ('RIDE',),
+    'place-brntn': ('EXIT',),
+}
+
+
+def describe_alert(alert):
+    """Format an alert as a one-line explanation, e.g. SHUTTLE: Shuttle buses replace Red Line service..."""
+    attributes = alert['attributes']
+    return f"{attributes.get('effect', 'ALERT')}: {attributes.get('header') or attributes.get('service_effect')}"
+
+
+class ServiceAlerts(object):
+    """
+    Active service alerts for a set of routes, indexed by route and stop.
+
+    Alerts are fetched from the MBTA /alerts endpoint at most once per refresh interval. Monitors wait
+    between prediction polls with sleep(), which keeps refreshing the alerts on that cadence and wakes
+    up early when a disruption starts or clears. The SSL-fixed client sends repeated fetches as
+    conditional requests, so an unchanged alert feed costs a 304 response and no re-indexing.
+
+    A watched leg is given as its stops, either as a list or as a dict of stop id to the activities
+    the leg needs there, e.g. {'place-sstat': ('BOARD',), 'place-jfk': ('RIDE',), 'place-brntn': ('EXIT',)}.
+    """
+
+    def __init__(self, routes, refresh_interval: int = 60, key: str = None):
+        """Initialize the alert index
+
+        Keyword Arguments:
+            routes: Route ids to watch, e.g. ['Red', '226']
+            refresh_interval: Minimum number of seconds between alert fetches
+            key: MBTA v3 api key, defaults to the MBTA_API_KEY environment variable
+        """
+        self.routes = [str(route) for route in routes]
+        self.refresh_interval = refresh_interval
+        self.key = key
+        self._client = None
+        self._response = None
+        self._fetched_at = None
+        # route -> stop (None for route-wide entities) -> [(informed entity, alert)]
+        self._by_route = {}
+
+    def refresh(self, force: bool = False):
+        """
+        Fetch the active alerts if the refresh interval has passed. Errors are reported and the previous
+        index is kept, so an alerts outage never blocks prediction queries.
+        Keyword Arguments:
+            force: Fetch even if the refresh interval has not passed yet
+        """
+        now = t.monotonic()
+        if not force and self._fetched_at is not None and now - self._fetched_at < self.refresh_interval:
+            return
+        self._fetched_at = now
+
+        try:
+            if self._client is None:
+                self._client = Alerts(key=self.key or os.environ.get('MBTA_API_KEY', 'demo'))
+            response = self._client.get(route=self.routes, datetime='NOW')
+        except Exception as e:
+            print(f"Error fetching service alerts: {str(e)}")
+            return
+
+        # A 304 Not Modified hands back the same document, which is already indexed
+        if response is not self._response:
+            self._response = response
+            self._index(response)
+
+    def sleep(self, minutes, until=None):
+        """
+        Sleep for the given minutes while refreshing alerts every refresh interval.
+        Keyword Arguments:
+            minutes: Minutes to sleep
+            until: Optional callable, the sleep ends early once it returns True after a refresh
+        """
+        deadline = t.monotonic() + minutes * 60
+        while True:
+            remaining = deadline - t.monotonic()
+            if remaining <= 0:
+                return
+            t.sleep(min(self.refresh_interval, remaining))
+            self.refresh()
+            if until is not None and until():
+                return
+
+    def pause(self, explanation, until=None):
+        """
+        Explain why prediction queries are skipped and pause them while a watched leg is disrupted.
+        Keyword Arguments:
+            explanation: Why the leg is disrupted, e.g. the described blocking alert
+            until: Optional callable, the pause ends early once it returns True, e.g. when the disruption clears
+        """
+        print(f"\n{explanation}")
+        print(f"Skipping predictions for up to {DISRUPTION_PAUSE_MINUTES} minutes, until the disruption clears...")
+        self.sleep(DISRUPTION_PAUSE_MINUTES, until=until)
+
+    def _index(self, alerts):
+        """Rebuild the route and stop index from an alerts response"""
+        by_route = {}
+        for alert in alerts.get('data') or []:
+            for entity in alert['attributes'].get('informed_entity') or []:
+                route = entity.get('route')
+                stop = entity.get('stop')
+                if route:
+                    by_route.setdefault(route, {}).setdefault(stop, []).append((entity, alert))
+        self._by_route = by_route
+
+    def affecting(self, route, stops=None, direction_id=None):
+        """
+        Return the active alerts for a route.
+        Keyword Arguments:
+            route: Route id, e.g. 'Red'
+            stops: Stops of the watched leg. When given, only route-wide alerts and alerts at these stops
+                are returned, so a disruption on another branch is ignored.
+            direction_id: Direction of travel of the watched leg, alerts for the other direction are ignored
+        """
+        route_alerts = self._by_route.get(str(route), {})
+        if stops is None:
+            leg = dict.fromkeys(route_alerts.keys())
+        elif isinstance(stops, dict):
+            leg = {str(stop): activities for stop, activities in stops.items()}
+        else:
+            leg = dict.fromkeys(str(stop) for stop in stops)
+
+        # Route-wide alerts matter for any activity the leg needs at any of its stops
+        if None not in leg:
+            if stops is None or None in leg.values():
+                leg[None] = None
+            else:
+                leg[None] = {activity for activities in leg.values() for activity in activities}
+
+        alerts = {}
+        for stop, activities in leg.items():
+            for entity, alert in route_alerts.get(stop, []):
+                if _entity_matches(entity, activities, direction_id):
+                    alerts[alert['id']] = alert
+        return list(alerts.values())
+
+    def blocking(self, route, stops=None, direction_id=None):
+        """Return an active alert that suspends, shuttles or closes the watched leg, or None"""
+        for alert in self.affecting(route, stops, direction_id):
+            if alert['attributes'].get('effect') in BLOCKING_EFFECTS:
+                return alert
+        return None
+
+    def print_active(self, route, stops=None, direction_id=None):
+        """Print the active alerts for a route, explaining why predictions may be missing"""
+        for alert in self.affecting(route, stops, direction_id):
+            print(f"  Active alert - {describe_alert(alert)}")
+
+
+def _entity_matches(entity, activities, direction_id):
+    """Check an informed entity against the activities and direction of a watched leg, None matches all"""
+    entity_direction = entity.get('direction_id')
+    if direction_id is not None and entity_direction is not None and int(entity_direction) != int(direction_id):
+        return False
+    if activities is None or not entity.get('activities'):
+        return True
+    return bool(set(activities) & set(entity['activities']))